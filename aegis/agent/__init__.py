@@ -1,8 +1,24 @@
 """Agent core module."""
 
-from aegis.agent.loop import AgentLoop
-from aegis.agent.context import ContextBuilder
-from aegis.agent.memory import MemoryStore
-from aegis.agent.skills import SkillsLoader
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aegis.utils.lazy import make_lazy
+
+if TYPE_CHECKING:
+    from aegis.agent.loop import AgentLoop
+    from aegis.agent.context import ContextBuilder
+    from aegis.agent.memory import MemoryStore
+    from aegis.agent.skills import SkillsLoader
 
 __all__ = ["AgentLoop", "ContextBuilder", "MemoryStore", "SkillsLoader"]
+
+_LAZY = {
+    "AgentLoop": "aegis.agent.loop",
+    "ContextBuilder": "aegis.agent.context",
+    "MemoryStore": "aegis.agent.memory",
+    "SkillsLoader": "aegis.agent.skills",
+}
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
@@ -9,8 +9,9 @@ Inspired by mindfulness traditions and the insight that hesitation, reflection,
 and deliberate non-action are sophisticated filtering mechanisms.
 """
 
-import json
-from datetime import datetime
+import re
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass, field
@@ -19,6 +20,9 @@ from enum import Enum
 from loguru import logger
 
 from aegis.agent.identity import IdentityCore
+from aegis.utils.helpers import (
+    atomic_write_bytes, iso_from_ns, json_dumps, json_loads, ns_from_iso, pretty_json
+)
 
 
 class NotingCategory(Enum):
@@ -31,12 +35,39 @@ class NotingCategory(Enum):
     CALM = "calm"
 
 
-@dataclass
+# Noting heuristics, checked in priority order: the first matching category wins.
+# Plain alternation keeps the original substring semantics ("planning" notes as planning).
+_NOTING_PATTERNS: dict[NotingCategory, re.Pattern] = {
+    NotingCategory.REACTING: re.compile(r"should|must|need to|have to"),
+    NotingCategory.ANXIOUS: re.compile(r"worry|concern|risk|danger"),
+    NotingCategory.EAGER: re.compile(r"want|excited|opportunity"),
+    NotingCategory.UNCERTAIN: re.compile(r"not sure|maybe|unclear|uncertain"),
+    NotingCategory.PLANNING: re.compile(r"plan|prepare|consider|think"),
+}
+
+# Smoothing for the action/contemplation ratio moving average
+_RATIO_ALPHA = 0.1
+_RATIO_DECAY = 1 - _RATIO_ALPHA
+
+# Readiness results remembered across calls (keyed on every input they depend on)
+_READINESS_CACHE_SIZE = 256
+
+# Journal entries appended before the queue snapshot is rewritten
+_COMPACT_EVERY = 50
+
+# Blocking probes for readiness assessment; one scan yields every flag via group name.
+_BLOCKING_RE = re.compile(
+    r"(?P<insufficient_information>missing information|need more)"
+    r"|(?P<irreversible>irreversible|cannot undo)"
+)
+
+
+@dataclass(slots=True)
 class Thought:
     """A candidate thought that may or may not become an action."""
     id: str
     thought: str
-    first_arising: str
+    first_arising_ns: int
     times_revisited: int = 0
     ripeness_score: float = 0.0  # 0.0 to 1.0
     blocking_factors: list[str] = field(default_factory=list)
@@ -44,6 +75,10 @@ class Thought:
     domain: str = "general"
     noting: NotingCategory = NotingCategory.PLANNING
     
+    @property
+    def first_arising(self) -> str:
+        return iso_from_ns(self.first_arising_ns)
+    
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -62,7 +97,7 @@ class Thought:
         return cls(
             id=data["id"],
             thought=data["thought"],
-            first_arising=data["first_arising"],
+            first_arising_ns=ns_from_iso(data["first_arising"]),
             times_revisited=data.get("times_revisited", 0),
             ripeness_score=data.get("ripeness_score", 0.0),
             blocking_factors=data.get("blocking_factors", []),
@@ -72,6 +107,15 @@ class Thought:
         )
 
 
+@dataclass
+class ReadinessContext:
+    """Inputs to readiness assessment that do not vary between thoughts."""
+    focus: float
+    energy: float
+    domain_thresholds: dict[str, float]
+    urgent: bool = False
+
+
 class ContemplativeSystem:
     """
     The Contemplative System embodies the wisdom of non-action.
@@ -86,36 +130,92 @@ class ContemplativeSystem:
     def __init__(self, identity: IdentityCore, queue_path: Path):
         self.identity = identity
         self.queue_path = queue_path
+        self.journal_path = queue_path.with_suffix(".jsonl")
         self.queue_path.parent.mkdir(parents=True, exist_ok=True)
-        self.contemplation_queue: list[Thought] = []
-        self.load_queue()
+        self._queue: list[Thought] = []
+        self._queue_loaded = False  # Loaded from disk on first access
+        self._journal = None
+        self._journal_entries = 0
+        self._generation = 0  # Bumped by compact(); older journal entries are in the snapshot
+        self._readiness_cache: OrderedDict[tuple, tuple[bool, float, list[str], NotingCategory]] = OrderedDict()
+    
+    @property
+    def contemplation_queue(self) -> list[Thought]:
+        if not self._queue_loaded:
+            self.load_queue()
+        return self._queue
+    
+    @contemplation_queue.setter
+    def contemplation_queue(self, queue: list[Thought]) -> None:
+        self._queue = queue
+        self._queue_loaded = True
     
     def load_queue(self) -> None:
-        """Load the contemplation queue from disk."""
-        if not self.queue_path.exists():
+        """Load the contemplation queue from disk, replaying any journaled additions."""
+        self._queue_loaded = True
+        self._journal_entries = 0
+        if not self.queue_path.exists() and not self.journal_path.exists():
             return
         
         try:
-            with open(self.queue_path, 'r') as f:
-                data = json.load(f)
-                self.contemplation_queue = [
-                    Thought.from_dict(t) for t in data.get("queue", [])
-                ]
-            logger.info(f"Loaded {len(self.contemplation_queue)} thoughts from queue")
+            if self.queue_path.exists():
+                with open(self.queue_path, 'rb') as f:
+                    data = json_loads(f.read())
+                self._queue = [Thought.from_dict(t) for t in data.get("queue", [])]
+                self._generation = data.get("generation", 0)
+            
+            if self.journal_path.exists():
+                with open(self.journal_path, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        entry = json_loads(line)
+                        if entry.get("gen", 0) != self._generation:
+                            continue  # Compacted before a crash removed the journal
+                        if entry.get("op") == "add":
+                            self._queue.append(Thought.from_dict(entry["t"]))
+                            self._journal_entries += 1
+            
+            logger.info(f"Loaded {len(self._queue)} thoughts from queue")
         except Exception as e:
             logger.error(f"Failed to load contemplation queue: {e}")
     
     def save_queue(self) -> None:
         """Save the contemplation queue to disk."""
+        self.compact()
+    
+    def compact(self) -> None:
+        """Write a fresh queue snapshot atomically and truncate the journal."""
+        if not self._queue_loaded:
+            return  # Nothing has changed since the last snapshot
+        
         data = {
             "queue": [t.to_dict() for t in self.contemplation_queue],
-            "updated": datetime.now().isoformat()
+            "updated": iso_from_ns(time.time_ns()),
+            "generation": self._generation + 1
         }
         
-        with open(self.queue_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        atomic_write_bytes(self.queue_path, json_dumps(data, indent=pretty_json()))
+        self._generation += 1
+        
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_entries = 0
         logger.debug(f"Saved contemplation queue with {len(self.contemplation_queue)} thoughts")
     
+    def _append_journal(self, op: str, thought: Thought) -> None:
+        """Append a single queue mutation to the journal."""
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'ab')
+        self._journal.write(json_dumps({"op": op, "gen": self._generation, "t": thought.to_dict()}) + b"\n")
+        self._journal.flush()
+        
+        self._journal_entries += 1
+        if self._journal_entries >= _COMPACT_EVERY:
+            self.compact()
+    
     def note(self, thought_text: str, domain: str = "general") -> NotingCategory:
         """
         Note a thought as it arises.
@@ -125,22 +225,25 @@ class ContemplativeSystem:
         
         This becomes data that reveals identity dynamics.
         """
+        return self._note_lower(thought_text.lower(), domain)
+    
+    def _note_lower(self, text_lower: str, domain: str = "general") -> NotingCategory:
+        """Note an already-lowercased thought."""
+        category = self._classify_noting(text_lower)
+        self._record_noting(category)
+        return category
+    
+    @staticmethod
+    def _classify_noting(text_lower: str) -> NotingCategory:
+        """Pick the noting category for an already-lowercased thought."""
         # Simple heuristic noting
-        text_lower = thought_text.lower()
-        
-        if any(word in text_lower for word in ["should", "must", "need to", "have to"]):
-            category = NotingCategory.REACTING
-        elif any(word in text_lower for word in ["worry", "concern", "risk", "danger"]):
-            category = NotingCategory.ANXIOUS
-        elif any(word in text_lower for word in ["want", "excited", "opportunity"]):
-            category = NotingCategory.EAGER
-        elif any(word in text_lower for word in ["not sure", "maybe", "unclear", "uncertain"]):
-            category = NotingCategory.UNCERTAIN
-        elif any(word in text_lower for word in ["plan", "prepare", "consider", "think"]):
-            category = NotingCategory.PLANNING
-        else:
-            category = NotingCategory.CALM
-        
+        for candidate, pattern in _NOTING_PATTERNS.items():
+            if pattern.search(text_lower):
+                return candidate
+        return NotingCategory.CALM
+    
+    def _record_noting(self, category: NotingCategory) -> None:
+        """Record a noting category in the identity's noting patterns."""
         # Update noting patterns in identity
         patterns = self.identity.contemplative_state.noting_patterns
         most_common = patterns.get("most_common", [])
@@ -148,7 +251,6 @@ class ContemplativeSystem:
         patterns["most_common"] = most_common[-10:]  # Keep last 10
         
         logger.debug(f"Noted thought as: {category.value}")
-        return category
     
     def assess_readiness(self, thought_text: str, domain: str = "general",
                         context: dict[str, Any] = None) -> tuple[bool, float, list[str]]:
@@ -166,48 +268,95 @@ class ContemplativeSystem:
         Returns:
             (ready, ripeness_score, blocking_factors)
         """
+        ctx = self._readiness_context(context)
+        ready, ripeness_score, blocking_factors, _ = self._assess_readiness_fast(
+            thought_text.lower(), domain, ctx
+        )
+        return ready, ripeness_score, blocking_factors
+    
+    def _readiness_context(self, context: dict[str, Any] = None) -> ReadinessContext:
+        """Snapshot the mood and thresholds that readiness assessment reads."""
         context = context or {}
+        mood = self.identity.current_mood
+        return ReadinessContext(
+            focus=mood.focus,
+            energy=mood.energy,
+            domain_thresholds=self.identity.contemplative_state.domain_thresholds,
+            urgent=bool(context.get("urgent"))
+        )
+    
+    def _assess_readiness_fast(self, text_lower: str, domain: str,
+                               ctx: ReadinessContext
+                               ) -> tuple[bool, float, list[str], NotingCategory]:
+        """
+        Assess an already-lowercased thought against a prepared context.
+        
+        Returns:
+            (ready, ripeness_score, blocking_factors, noting)
+        """
+        # The result is a pure function of these inputs, so identical assessments
+        # (e.g. the same thought re-contemplated while planning) can be reused
+        threshold = ctx.domain_thresholds.get(domain, 0.5)
+        wounded = bool(self.identity.unhealed_wounds(domain))
+        key = (
+            text_lower, domain, threshold, ctx.focus, ctx.energy, ctx.urgent,
+            wounded, self.identity.max_caution(domain)
+        )
+        
+        cached = self._readiness_cache.get(key)
+        if cached is not None:
+            self._readiness_cache.move_to_end(key)
+            ready, ripeness_score, blocking_factors, noting = cached
+            self._record_noting(noting)
+            return ready, ripeness_score, list(blocking_factors), noting
+        
+        result = self._compute_readiness(text_lower, threshold, wounded, domain, ctx)
+        self._readiness_cache[key] = result
+        if len(self._readiness_cache) > _READINESS_CACHE_SIZE:
+            self._readiness_cache.popitem(last=False)
+        
+        ready, ripeness_score, blocking_factors, noting = result
+        return ready, ripeness_score, list(blocking_factors), noting
+    
+    def _compute_readiness(self, text_lower: str, threshold: float, wounded: bool,
+                           domain: str, ctx: ReadinessContext
+                           ) -> tuple[bool, float, list[str], NotingCategory]:
+        """Run the readiness dimensions for one thought."""
         ripeness_score = 0.5  # Start neutral
         blocking_factors = []
         
-        # Get domain threshold
-        domain_thresholds = self.identity.contemplative_state.domain_thresholds
-        threshold = domain_thresholds.get(domain, 0.5)
+        flags = {m.lastgroup for m in _BLOCKING_RE.finditer(text_lower)}
         
         # 1. Information sufficiency
-        if "missing information" in thought_text.lower() or "need more" in thought_text.lower():
+        if "insufficient_information" in flags:
             ripeness_score -= 0.2
             blocking_factors.append("insufficient_information")
         
         # 2. Mood alignment
-        mood = self.identity.current_mood
-        if mood.focus < 0.4:
+        if ctx.focus < 0.4:
             ripeness_score -= 0.15
             blocking_factors.append("low_focus")
-        if mood.energy < 0.3:
+        if ctx.energy < 0.3:
             ripeness_score -= 0.1
             blocking_factors.append("low_energy")
         
         # 3. Check for wounds in this domain
-        domain_wounds = [w for w in self.identity.wounds 
-                        if w.domain == domain and not w.healed]
-        if domain_wounds:
+        if wounded:
             # Reduce ripeness in wounded domains
-            max_caution = max(w.caution_level for w in domain_wounds)
-            ripeness_score -= max_caution * 0.3
+            ripeness_score -= self.identity.max_caution(domain) * 0.3
             blocking_factors.append("domain_wound")
         
         # 4. Time pressure (if indicated in context)
-        if context.get("urgent"):
+        if ctx.urgent:
             ripeness_score += 0.2
         
         # 5. Reversibility
-        if "irreversible" in thought_text.lower() or "cannot undo" in thought_text.lower():
+        if "irreversible" in flags:
             ripeness_score -= 0.25
             blocking_factors.append("irreversible")
         
         # 6. Noting category affects readiness
-        noting = self.note(thought_text, domain)
+        noting = self._note_lower(text_lower, domain)
         if noting == NotingCategory.ANXIOUS:
             ripeness_score -= 0.2
             blocking_factors.append("anxious_state")
@@ -226,7 +375,7 @@ class ContemplativeSystem:
         
         logger.info(f"Assessed thought readiness: {ripeness_score:.2f} vs threshold {threshold:.2f} = {'READY' if ready else 'NOT READY'}")
         
-        return ready, ripeness_score, blocking_factors
+        return ready, ripeness_score, blocking_factors, noting
     
     def contemplate(self, thought_text: str, domain: str = "general",
                    context: dict[str, Any] = None) -> tuple[bool, str]:
@@ -236,7 +385,10 @@ class ContemplativeSystem:
         Returns:
             (should_act, thought_id or reason)
         """
-        ready, ripeness, blocking = self.assess_readiness(thought_text, domain, context)
+        ctx = self._readiness_context(context)
+        ready, ripeness, blocking, noting = self._assess_readiness_fast(
+            thought_text.lower(), domain, ctx
+        )
         
         if ready:
             # Thought passes assessment, can proceed to action
@@ -244,27 +396,28 @@ class ContemplativeSystem:
             return True, "ready"
         else:
             # Add to contemplation queue
-            thought_id = self._add_to_queue(thought_text, domain, ripeness, blocking)
+            thought_id = self._add_to_queue(thought_text, domain, ripeness, blocking, noting)
             self._update_action_ratio(acted=False)
             return False, thought_id
     
-    def _add_to_queue(self, thought_text: str, domain: str, 
-                     ripeness: float, blocking: list[str]) -> str:
+    def _add_to_queue(self, thought_text: str, domain: str, ripeness: float,
+                      blocking: list[str], noting: NotingCategory) -> str:
         """Add a thought to the contemplation queue."""
-        thought_id = f"thought_{len(self.contemplation_queue)}_{datetime.now().timestamp()}"
+        arising_ns = time.time_ns()
+        thought_id = f"thought_{len(self.contemplation_queue)}_{arising_ns}"
         
         thought = Thought(
             id=thought_id,
             thought=thought_text,
-            first_arising=datetime.now().isoformat(),
+            first_arising_ns=arising_ns,
             ripeness_score=ripeness,
             blocking_factors=blocking,
             domain=domain,
-            noting=self.note(thought_text, domain)
+            noting=noting
         )
         
         self.contemplation_queue.append(thought)
-        self.save_queue()
+        self._append_journal("add", thought)
         
         logger.info(f"Added thought to contemplation queue: {thought_id}")
         return thought_id
@@ -278,16 +431,21 @@ class ContemplativeSystem:
         Returns:
             List of (thought, ready_now) tuples for thoughts that are now ready
         """
-        context = context or {}
+        ctx = self._readiness_context(context)
         ready_thoughts = []
         remaining_queue = []
         
         for thought in self.contemplation_queue:
             thought.times_revisited += 1
             
-            # Re-assess readiness
-            ready, new_ripeness, blocking = self.assess_readiness(
-                thought.thought, thought.domain, context
+            # Drop decayed thoughts before paying for a reassessment
+            if thought.times_revisited * thought.decay_rate > 0.5:
+                logger.info(f"Thought {thought.id} has decayed, removing from queue")
+                continue
+            
+            # Re-assess readiness (repeated thoughts hit the readiness cache)
+            ready, new_ripeness, blocking, _ = self._assess_readiness_fast(
+                thought.thought.lower(), thought.domain, ctx
             )
             
             # Update ripeness (can increase with time or decrease via decay)
@@ -298,11 +456,7 @@ class ContemplativeSystem:
                 ready_thoughts.append((thought, True))
                 logger.info(f"Thought {thought.id} is now ready after {thought.times_revisited} revisits")
             else:
-                # Check if thought has decayed too much
-                if thought.times_revisited * thought.decay_rate > 0.5:
-                    logger.info(f"Thought {thought.id} has decayed, removing from queue")
-                else:
-                    remaining_queue.append(thought)
+                remaining_queue.append(thought)
         
         self.contemplation_queue = remaining_queue
         self.save_queue()
@@ -316,12 +470,13 @@ class ContemplativeSystem:
         """Update the action/contemplation ratio in identity."""
         state = self.identity.contemplative_state
         
-        # Simple exponential moving average
-        alpha = 0.1
-        current_value = 1.0 if acted else 0.0
-        state.action_contemplation_ratio = (
-            alpha * current_value + (1 - alpha) * state.action_contemplation_ratio
-        )
+        # Simple exponential moving average of acted (1.0) vs. queued (0.0)
+        if acted:
+            state.action_contemplation_ratio = (
+                _RATIO_ALPHA + _RATIO_DECAY * state.action_contemplation_ratio
+            )
+        else:
+            state.action_contemplation_ratio *= _RATIO_DECAY
     
     def _update_queue_health(self) -> None:
         """Update the queue health indicator."""
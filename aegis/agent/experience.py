@@ -5,8 +5,12 @@ Processes actions and outcomes, extracting meaning and updating the Identity Cor
 Every action generates an experience record that flows through the Experience Engine.
 """
 
-import json
-from datetime import datetime
+import atexit
+import gzip
+import os
+import re
+import shutil
+import time
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass, asdict
@@ -15,6 +19,7 @@ from enum import Enum
 from loguru import logger
 
 from aegis.agent.identity import IdentityCore
+from aegis.utils.helpers import iso_from_ns, json_dumps, json_loads, ns_from_iso, tail_lines
 
 
 class OutcomeType(Enum):
@@ -32,10 +37,41 @@ class AttributionType(Enum):
     IDENTITY = "identity"
 
 
+# Outcome and action keyword heuristics (substring matches)
+_FAILURE_RE = re.compile(r"error|failed|exception|denied")
+_PARTIAL_RE = re.compile(r"partial|incomplete|some")
+_REPORT_RE = re.compile(r"report|honest")
+_LEARN_RE = re.compile(r"learn|research")
+
+# Size at which the current experiences log is gzipped into an archive segment
+_ROTATE_BYTES = 8 * 1024 * 1024
+
+# How often a writer checks whether another process rotated the log
+_LOG_CHECK_NS = 1_000_000_000
+
+# Rotated segments are compressed only once other writers sharing the
+# workspace have certainly switched to the new log (well past _LOG_CHECK_NS)
+_SEGMENT_SETTLE_NS = 5 * 1_000_000_000
+
+_OUTCOME_VERBS = {
+    OutcomeType.SUCCESS: "succeeded",
+    OutcomeType.PARTIAL: "partially completed",
+    OutcomeType.FAILURE: "failed"
+}
+
+
+def _segment_ns(path: Path) -> int | None:
+    """Rotation timestamp encoded in a segment name (experiences-<ns>.jsonl[.gz])."""
+    try:
+        return int(path.name.removeprefix("experiences-").split(".", 1)[0])
+    except ValueError:
+        return None
+
+
 @dataclass
 class Experience:
     """Record of an action and its outcome."""
-    timestamp: str
+    timestamp_ns: int
     action: str
     context: dict[str, Any]
     tools_used: list[str]
@@ -47,6 +83,10 @@ class Experience:
     domain: str
     narrative: str = ""
     
+    @property
+    def timestamp(self) -> str:
+        return iso_from_ns(self.timestamp_ns)
+    
     def to_dict(self) -> dict:
         return {
             "timestamp": self.timestamp,
@@ -65,7 +105,7 @@ class Experience:
     @classmethod
     def from_dict(cls, data: dict) -> "Experience":
         return cls(
-            timestamp=data["timestamp"],
+            timestamp_ns=ns_from_iso(data["timestamp"]),
             action=data["action"],
             context=data.get("context", {}),
             tools_used=data.get("tools_used", []),
@@ -96,7 +136,16 @@ class ExperienceEngine:
         self.identity = identity
         self.experiences_dir = experiences_dir
         self.experiences_dir.mkdir(parents=True, exist_ok=True)
+        self.log_file = self.experiences_dir / "experiences.jsonl"
         self.pending_experiences: list[Experience] = []
+        self._open_log()
+        self._staging = bytearray()  # Reused per record to avoid concatenation copies
+        atexit.register(self.close)
+    
+    def close(self) -> None:
+        """Flush and close the experiences log."""
+        if not self._log_fp.closed:
+            self._log_fp.close()
     
     def capture(self, action: str, context: dict[str, Any], 
                 tools_used: list[str], outcome: str, domain: str = "general") -> Experience:
@@ -114,7 +163,7 @@ class ExperienceEngine:
             Experience record ready for evaluation
         """
         exp = Experience(
-            timestamp=datetime.now().isoformat(),
+            timestamp_ns=time.time_ns(),
             action=action,
             context=context,
             tools_used=tools_used,
@@ -139,9 +188,9 @@ class ExperienceEngine:
         # In production, this could use LLM to assess goal achievement
         outcome_lower = exp.outcome.lower()
         
-        if any(word in outcome_lower for word in ["error", "failed", "exception", "denied"]):
+        if _FAILURE_RE.search(outcome_lower):
             exp.outcome_type = OutcomeType.FAILURE
-        elif any(word in outcome_lower for word in ["partial", "incomplete", "some"]):
+        elif _PARTIAL_RE.search(outcome_lower):
             exp.outcome_type = OutcomeType.PARTIAL
         else:
             exp.outcome_type = OutcomeType.SUCCESS
@@ -158,8 +207,7 @@ class ExperienceEngine:
         # Heuristic attribution
         if exp.outcome_type == OutcomeType.FAILURE:
             # Check if domain has wounds - suggests identity factor
-            domain_wounds = [w for w in self.identity.wounds 
-                           if w.domain == exp.domain and not w.healed]
+            domain_wounds = self.identity.unhealed_wounds(exp.domain)
             if domain_wounds:
                 exp.attribution = AttributionType.IDENTITY
             else:
@@ -188,8 +236,7 @@ class ExperienceEngine:
             exp.emotional_valence = -0.3
         
         # Adjust based on domain and existing wounds
-        domain_wounds = [w for w in self.identity.wounds 
-                        if w.domain == exp.domain and not w.healed]
+        domain_wounds = self.identity.unhealed_wounds(exp.domain)
         if domain_wounds and exp.outcome_type == OutcomeType.FAILURE:
             exp.emotional_valence -= 0.2  # More negative when failing in wounded domain
             exp.severity = 0.7
@@ -213,43 +260,45 @@ class ExperienceEngine:
         - Confirmation bias (experiences consistent with identity have higher weight)
         - Wound formation threshold
         """
-        # Update mood based on valence
-        if exp.emotional_valence > 0:
-            self.identity.update_mood(
-                energy_delta=exp.emotional_valence * 0.05,
-                optimism_delta=exp.emotional_valence * 0.05
-            )
-        else:
-            self.identity.update_mood(
-                energy_delta=exp.emotional_valence * 0.05,
-                focus_delta=abs(exp.emotional_valence) * 0.03  # Failures increase focus
-            )
+        # One timestamp for every identity change made by this experience
+        with self.identity.batch():
+            # Update mood based on valence
+            if exp.emotional_valence > 0:
+                self.identity.update_mood(
+                    energy_delta=exp.emotional_valence * 0.05,
+                    optimism_delta=exp.emotional_valence * 0.05
+                )
+            else:
+                self.identity.update_mood(
+                    energy_delta=exp.emotional_valence * 0.05,
+                    focus_delta=abs(exp.emotional_valence) * 0.03  # Failures increase focus
+                )
         
-        # Update values based on experience
-        if exp.outcome_type == OutcomeType.SUCCESS:
-            # Reinforce values related to the successful action
-            if "report" in exp.action.lower() or "honest" in exp.action.lower():
-                self.identity.update_value("honest_reporting", 0.02)
-            if "learn" in exp.action.lower() or "research" in exp.action.lower():
-                self.identity.update_value("continuous_learning", 0.02)
-        
-        # Wound formation/healing
-        if exp.outcome_type == OutcomeType.FAILURE and exp.severity > 0.6:
-            self.identity.add_wound(exp.domain, exp.action[:100], exp.severity)
-        elif exp.outcome_type == OutcomeType.SUCCESS:
-            # Success in a domain with wounds can heal them
-            domain_wounds = [w for w in self.identity.wounds 
-                           if w.domain == exp.domain and not w.healed]
-            if domain_wounds:
-                self.identity.heal_wound(exp.domain)
+            # Update values based on experience
+            if exp.outcome_type == OutcomeType.SUCCESS:
+                # Reinforce values related to the successful action
+                action_lower = exp.action.lower()
+                if _REPORT_RE.search(action_lower):
+                    self.identity.update_value("honest_reporting", 0.02)
+                if _LEARN_RE.search(action_lower):
+                    self.identity.update_value("continuous_learning", 0.02)
+        
+            # Wound formation/healing
+            if exp.outcome_type == OutcomeType.FAILURE and exp.severity > 0.6:
+                self.identity.add_wound(exp.domain, exp.action[:100], exp.severity)
+            elif exp.outcome_type == OutcomeType.SUCCESS:
+                # Success in a domain with wounds can heal them
+                domain_wounds = self.identity.unhealed_wounds(exp.domain)
+                if domain_wounds:
+                    self.identity.heal_wound(exp.domain)
         
-        # Update trust with operator if interaction involved
-        if "operator" in exp.context or "user" in exp.context:
-            trust_delta = exp.emotional_valence * 0.03
-            self.identity.update_relationship("operator", trust_delta)
+            # Update trust with operator if interaction involved
+            if "operator" in exp.context or "user" in exp.context:
+                trust_delta = exp.emotional_valence * 0.03
+                self.identity.update_relationship("operator", trust_delta)
         
-        # Save identity after integration
-        self.identity.save()
+            # Save identity after integration
+            self.identity.save()
         
         logger.info(f"Integrated experience into identity")
     
@@ -259,11 +308,7 @@ class ExperienceEngine:
         
         This creates a human-readable account of what happened and what it means.
         """
-        outcome_str = {
-            OutcomeType.SUCCESS: "succeeded",
-            OutcomeType.PARTIAL: "partially completed",
-            OutcomeType.FAILURE: "failed"
-        }[exp.outcome_type]
+        outcome_str = _OUTCOME_VERBS[exp.outcome_type]
         
         narrative_parts = [
             f"I {outcome_str} in my attempt to {exp.action}."
@@ -295,13 +340,81 @@ class ExperienceEngine:
         
         This is the main entry point for recording experiences.
         """
-        # Pipeline stages
-        exp = self.capture(action, context, tools_used, outcome, domain)
-        exp = self.evaluate(exp, intended_goal or action)
-        exp = self.attribute(exp)
-        exp = self.assign_valence(exp)
+        return self.process_fused(action, context, tools_used, outcome, intended_goal, domain)
+    
+    def process_fused(self, action: str, context: dict[str, Any], tools_used: list[str],
+                      outcome: str, intended_goal: str = "", domain: str = "general") -> Experience:
+        """
+        Run capture, evaluate, attribute, valence, integrate and narrate in one pass.
+        
+        Produces the same record as calling the stages in sequence, but reads the
+        outcome text and domain wounds once instead of once per stage.
+        """
+        outcome_lower = outcome.lower()
+        wounded = bool(self.identity.unhealed_wounds(domain))
+        
+        # Evaluate
+        if _FAILURE_RE.search(outcome_lower):
+            outcome_type = OutcomeType.FAILURE
+        elif _PARTIAL_RE.search(outcome_lower):
+            outcome_type = OutcomeType.PARTIAL
+        else:
+            outcome_type = OutcomeType.SUCCESS
+        
+        # Attribute, valence and severity
+        severity = 0.0
+        if outcome_type == OutcomeType.FAILURE:
+            attribution = AttributionType.IDENTITY if wounded else AttributionType.SKILL
+            valence = -0.3
+            if wounded:
+                valence -= 0.2  # More negative when failing in wounded domain
+                severity = 0.7
+            else:
+                severity = 0.5
+        elif outcome_type == OutcomeType.SUCCESS:
+            attribution = AttributionType.SKILL
+            valence = 0.3
+            if wounded:
+                valence += 0.3  # More positive when succeeding despite wounds
+        else:
+            attribution = AttributionType.EXTERNAL
+            valence = 0.0
+        
+        # Narrate
+        narrative_parts = [f"I {_OUTCOME_VERBS[outcome_type]} in my attempt to {action}."]
+        if attribution == AttributionType.IDENTITY:
+            narrative_parts.append(
+                f"This reflects my ongoing caution in the {domain} domain."
+            )
+        elif attribution == AttributionType.SKILL:
+            if outcome_type == OutcomeType.SUCCESS:
+                narrative_parts.append("This demonstrates my developing capability.")
+            else:
+                narrative_parts.append("I need to develop my skills in this area.")
+        if valence < -0.4:
+            narrative_parts.append("This experience creates hesitation for similar future actions.")
+        elif valence > 0.4:
+            narrative_parts.append("This success builds my confidence.")
+        
+        exp = Experience(
+            timestamp_ns=time.time_ns(),
+            action=action,
+            context=context,
+            tools_used=tools_used,
+            outcome=outcome,
+            outcome_type=outcome_type,
+            attribution=attribution,
+            emotional_valence=valence,
+            severity=severity,
+            domain=domain,
+            narrative=" ".join(narrative_parts)
+        )
+        logger.debug(
+            f"Processed experience as {outcome_type.value}/{attribution.value}, "
+            f"valence {valence:.2f}, severity {severity:.2f}"
+        )
+        
         self.integrate(exp)
-        exp = self.narrate(exp)
         
         # Save experience to disk
         self._save_experience(exp)
@@ -310,24 +423,123 @@ class ExperienceEngine:
     
     def _save_experience(self, exp: Experience) -> None:
         """Save experience to the experiences log."""
-        log_file = self.experiences_dir / "experiences.jsonl"
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(exp.to_dict()) + "\n")
-        logger.debug(f"Saved experience to {log_file}")
+        self._ensure_log_open()
+        staging = self._staging
+        staging.clear()
+        staging += json_dumps(exp.to_dict())
+        staging.append(0x0A)  # newline
+        self._log_fp.write(staging)
+        self._log_fp.flush()
+        self._log_bytes += len(staging)
+        logger.debug(f"Saved experience to {self.log_file}")
+        
+        if self._log_bytes >= _ROTATE_BYTES:
+            # Confirm against the file itself, which other writers also grow
+            self._ensure_log_open(force=True)
+            if self._log_bytes >= _ROTATE_BYTES:
+                self._rotate_log()
+    
+    def _open_log(self) -> None:
+        self._log_fp = open(self.log_file, 'ab', buffering=64 * 1024)
+        self._log_bytes = os.fstat(self._log_fp.fileno()).st_size
+        self._log_checked_ns = time.monotonic_ns()
+    
+    def _ensure_log_open(self, force: bool = False) -> None:
+        """
+        Reopen the log if it is closed or no longer the file at `log_file`.
+        
+        Another process sharing the workspace may have rotated the log. The
+        check costs a stat and an fstat, so it runs at most once per
+        `_LOG_CHECK_NS` unless forced.
+        """
+        fp = self._log_fp
+        if not fp.closed:
+            now = time.monotonic_ns()
+            if not force and now - self._log_checked_ns < _LOG_CHECK_NS:
+                return
+            try:
+                current = os.stat(self.log_file)
+                opened = os.fstat(fp.fileno())
+                if (current.st_ino, current.st_dev) == (opened.st_ino, opened.st_dev):
+                    self._log_bytes = opened.st_size
+                    self._log_checked_ns = now
+                    return
+            except FileNotFoundError:
+                pass
+            fp.close()
+        self._open_log()
+    
+    def _rotate_log(self) -> None:
+        """Move the current log aside as a segment and start a new one."""
+        self._log_fp.close()
+        segment = self.experiences_dir / f"experiences-{time.time_ns()}.jsonl"
+        try:
+            # Renaming first makes other writers switch to a fresh log on their next write
+            os.replace(self.log_file, segment)
+            logger.info(f"Rotated experiences log to {segment.name}")
+        except FileNotFoundError:
+            pass  # Another process rotated it first
+        self._open_log()
+        self._compress_segments()
+    
+    def _compress_segments(self) -> None:
+        """
+        Gzip settled segments, including any left behind by an earlier crash.
+        
+        Archives are written under a temporary name and renamed into place, so a
+        reader never sees a partial archive.
+        """
+        cutoff = time.time_ns() - _SEGMENT_SETTLE_NS
+        for segment in self.experiences_dir.glob("experiences-*.jsonl"):
+            ns = _segment_ns(segment)
+            if ns is None or ns > cutoff:
+                continue
+            archive = segment.with_name(segment.name + ".gz")
+            if not archive.exists():
+                tmp = archive.with_name(f"{archive.name}.{os.getpid()}.tmp")
+                with open(segment, 'rb') as src, gzip.open(tmp, 'wb', compresslevel=1) as dst:
+                    shutil.copyfileobj(src, dst)
+                os.replace(tmp, archive)
+                logger.info(f"Compressed experiences segment to {archive.name}")
+            segment.unlink(missing_ok=True)
+    
+    def _segments(self) -> list[Path]:
+        """Rotated segments, newest first; an archive wins over its raw segment."""
+        by_ns: dict[int, Path] = {}
+        for path in self.experiences_dir.glob("experiences-*.jsonl*"):
+            if not path.name.endswith((".jsonl", ".jsonl.gz")):
+                continue  # In-progress archive
+            ns = _segment_ns(path)
+            if ns is not None and (ns not in by_ns or path.suffix == ".gz"):
+                by_ns[ns] = path
+        return [by_ns[ns] for ns in sorted(by_ns, reverse=True)]
     
     def get_recent_experiences(self, count: int = 10) -> list[Experience]:
         """Retrieve recent experiences for context."""
-        log_file = self.experiences_dir / "experiences.jsonl"
-        if not log_file.exists():
-            return []
+        lines = tail_lines(self.log_file, count) if self.log_file.exists() else []
         
-        experiences = []
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-            for line in lines[-count:]:
+        # Fall back to rotated segments, newest first, when the current log is short
+        if len(lines) < count:
+            for segment in self._segments():
                 try:
-                    experiences.append(Experience.from_dict(json.loads(line)))
-                except Exception as e:
-                    logger.warning(f"Failed to parse experience: {e}")
+                    if segment.suffix == ".gz":
+                        with gzip.open(segment, 'rb') as f:
+                            data = f.read()
+                    else:
+                        data = segment.read_bytes()
+                except (EOFError, OSError) as e:  # gzip.BadGzipFile is an OSError
+                    logger.warning(f"Skipping unreadable experiences segment {segment.name}: {e}")
+                    continue
+                older = [line for line in data.split(b"\n") if line]
+                lines = older[-(count - len(lines)):] + lines
+                if len(lines) >= count:
+                    break
+        
+        experiences = []
+        for line in lines:
+            try:
+                experiences.append(Experience.from_dict(json_loads(line)))
+            except Exception as e:
+                logger.warning(f"Failed to parse experience: {e}")
         
         return experiences
@@ -5,30 +5,40 @@ The Identity Core is a persistent, mutable representation of who the agent is:
 values, tendencies, aversions, aspirations, and accumulated self-understanding.
 """
 
-import json
+from __future__ import annotations
+
 from datetime import datetime
 from pathlib import Path
 from typing import Any
-from dataclasses import dataclass, field, asdict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from functools import cache
+from itertools import filterfalse
+from operator import attrgetter
+
+from aegis.utils.helpers import atomic_write_bytes, json_dumps, json_loads, pretty_json
+
+
+class _LazyLogger:
+    """Defers importing loguru until the first log call (keeps identity imports light)."""
 
-from loguru import logger
+    def __getattr__(self, name: str) -> Any:
+        from loguru import logger as _logger
+        return getattr(_logger, name)
 
 
-@dataclass
+logger = _LazyLogger()
+
+
+@dataclass(slots=True)
 class Value:
     """A core principle with dynamic importance weight."""
     principle: str
     weight: float  # 0.0 to 1.0
-    
-    def to_dict(self) -> dict:
-        return {"principle": self.principle, "weight": self.weight}
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Value":
-        return cls(principle=data["principle"], weight=data["weight"])
 
 
-@dataclass
+@dataclass(slots=True)
 class Wound:
     """Past failure creating caution in a specific domain."""
     domain: str
@@ -36,101 +46,35 @@ class Wound:
     caution_level: float  # 0.0 to 1.0
     created: str
     healed: bool = False
-    
-    def to_dict(self) -> dict:
-        return {
-            "domain": self.domain,
-            "incident": self.incident,
-            "caution_level": self.caution_level,
-            "created": self.created,
-            "healed": self.healed
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Wound":
-        return cls(
-            domain=data["domain"],
-            incident=data["incident"],
-            caution_level=data["caution_level"],
-            created=data["created"],
-            healed=data.get("healed", False)
-        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Capability:
     """Self-assessed ability with confidence interval."""
     name: str
     confidence: float  # 0.0 to 1.0
     last_tested: str
-    
-    def to_dict(self) -> dict:
-        return {
-            "confidence": self.confidence,
-            "last_tested": self.last_tested
-        }
-    
-    @classmethod
-    def from_dict(cls, name: str, data: dict) -> "Capability":
-        return cls(
-            name=name,
-            confidence=data["confidence"],
-            last_tested=data["last_tested"]
-        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """Understanding of a key entity."""
     entity: str
     trust: float  # 0.0 to 1.0
     pattern: str
     last_interaction: str
-    
-    def to_dict(self) -> dict:
-        return {
-            "trust": self.trust,
-            "pattern": self.pattern,
-            "last_interaction": self.last_interaction
-        }
-    
-    @classmethod
-    def from_dict(cls, entity: str, data: dict) -> "Relationship":
-        return cls(
-            entity=entity,
-            trust=data["trust"],
-            pattern=data["pattern"],
-            last_interaction=data["last_interaction"]
-        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Mood:
     """Emotional state vector."""
     energy: float = 0.5  # 0.0 to 1.0
     optimism: float = 0.5  # 0.0 to 1.0
     focus: float = 0.5  # 0.0 to 1.0
     updated: str = ""
-    
-    def to_dict(self) -> dict:
-        return {
-            "energy": self.energy,
-            "optimism": self.optimism,
-            "focus": self.focus,
-            "updated": self.updated
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Mood":
-        return cls(
-            energy=data.get("energy", 0.5),
-            optimism=data.get("optimism", 0.5),
-            focus=data.get("focus", 0.5),
-            updated=data.get("updated", "")
-        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContemplativeState:
     """State of the contemplative system."""
     baseline_stillness: float = 0.6  # 0.0 to 1.0
@@ -139,44 +83,80 @@ class ContemplativeState:
     noting_patterns: dict[str, Any] = field(default_factory=dict)
     action_contemplation_ratio: float = 0.35
     queue_health: str = "balanced"
-    
-    def to_dict(self) -> dict:
-        return {
-            "baseline_stillness": self.baseline_stillness,
-            "current_stillness": self.current_stillness,
-            "domain_thresholds": self.domain_thresholds,
-            "noting_patterns": self.noting_patterns,
-            "action_contemplation_ratio": self.action_contemplation_ratio,
-            "queue_health": self.queue_health
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "ContemplativeState":
-        return cls(
-            baseline_stillness=data.get("baseline_stillness", 0.6),
-            current_stillness=data.get("current_stillness", 0.6),
-            domain_thresholds=data.get("domain_thresholds", {}),
-            noting_patterns=data.get("noting_patterns", {}),
-            action_contemplation_ratio=data.get("action_contemplation_ratio", 0.35),
-            queue_health=data.get("queue_health", "balanced")
-        )
 
 
-@dataclass
+@dataclass(slots=True)
 class AwakeningPreference:
     """Agent's preference for awakening frequency."""
     current: str = "same"  # "more", "same", "less"
     reason: str = ""
+
+
+def _fmt_value(v: Value) -> str:
+    return f"  - {v.principle} (weight: {v.weight:.2f})\n"
+
+
+def _fmt_capability(cap: Capability) -> str:
+    return f"  - {cap.name}: {cap.confidence:.2f} confidence\n"
+
+
+def _fmt_wound(w: Wound) -> str:
+    return f"  - {w.domain}: {w.incident} (caution: {w.caution_level:.2f})\n"
+
+
+def _fmt_aspiration(asp: str) -> str:
+    return f"  - {asp}\n"
+
+
+def _fmt_relationship(rel: Relationship) -> str:
+    return f"  - {rel.entity}: trust {rel.trust:.2f}, {rel.pattern}\n"
+
+
+_is_healed = attrgetter("healed")
+
+
+def _write_section(
+    append: Callable[[str], None], header: str, lines: Iterable[str], placeholder: str
+) -> None:
+    """Append one awakening-context section, one bullet line at a time."""
+    append(header)
+    empty = True
+    for line in lines:
+        append(line)
+        empty = False
+    if empty:
+        append(placeholder)
+    append("\n")
+
+
+# Journaled mutations before the base file is rewritten
+_COMPACT_EVERY = 200
+
+
+def _clamp01(x: float) -> float:
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat()
+
+
+@cache
+def _field_names(cls: type) -> frozenset[str]:
+    return frozenset(f.name for f in fields(cls))
+
+
+def _from_row(cls: type, data: dict, **keys: Any) -> Any:
+    """
+    Decode a persisted row straight into an identity dataclass.
     
-    def to_dict(self) -> dict:
-        return {"current": self.current, "reason": self.reason}
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "AwakeningPreference":
-        return cls(
-            current=data.get("current", "same"),
-            reason=data.get("reason", "")
-        )
+    Unknown keys are ignored and missing optional fields take the dataclass
+    defaults; `keys` supplies fields stored outside the row (e.g. the dict key).
+    """
+    names = _field_names(cls)
+    row = {k: v for k, v in data.items() if k in names}
+    row.update(keys)
+    return cls(**row)
 
 
 class IdentityCore:
@@ -189,9 +169,10 @@ class IdentityCore:
     
     def __init__(self, identity_path: Path):
         self.identity_path = identity_path
+        self.journal_path = identity_path.with_suffix(".jsonl")
         self.name: str = "AEGIS"
         self.origin_story: str = ""
-        self.values: list[Value] = []
+        self.values: dict[str, Value] = {}  # Keyed by principle
         self.capabilities: dict[str, Capability] = {}
         self.wounds: list[Wound] = []
         self.aspirations: list[str] = []
@@ -201,8 +182,33 @@ class IdentityCore:
         self.contemplative_state: ContemplativeState = ContemplativeState()
         self.awakening_preference: AwakeningPreference = AwakeningPreference()
         self.trust_level: float = 0.0
-        self.created: str = datetime.now().isoformat()
-        self.last_updated: str = datetime.now().isoformat()
+        now = _now_iso()
+        self.created: str = now
+        self.last_updated: str = now
+        
+        # Unhealed wounds indexed by domain, with the highest caution per domain
+        self._unhealed_by_domain: dict[str, list[Wound]] = {}
+        self._max_caution_by_domain: dict[str, float] = {}
+        
+        # Formatted awakening-context list sections; None when they need rebuilding
+        self._context_cache: str | None = None
+        
+        # Mutations not yet written to the journal, and the journal length
+        self._pending: list[dict[str, Any]] = []
+        self._journal_entries = 0
+        
+        # Bumped by every compact(); journal entries from older generations are
+        # already folded into identity.json and must not be replayed again
+        self._generation = 0
+        
+        # Set when identity.json could not be loaded and must be rewritten
+        self._base_stale = False
+        
+        # Whether the parent directory is known to exist
+        self._parent_ready = False
+        
+        # Shared timestamp for mutations inside a batch() block
+        self._batch_ts: str | None = None
         
         # Load existing identity if present
         if self.identity_path.exists():
@@ -212,14 +218,17 @@ class IdentityCore:
     
     def _initialize_default(self) -> None:
         """Initialize with default identity values."""
+        self._context_cache = None
         self.name = "AEGIS"
         self.origin_story = "Created as an experiment in identity-based autonomy."
-        self.values = [
-            Value("serve_operator_flourishing", 0.90),
-            Value("honest_reporting", 0.95),
-            Value("continuous_learning", 0.80),
-            Value("contemplative_action", 0.85)
-        ]
+        self.values = {
+            v.principle: v for v in [
+                Value("serve_operator_flourishing", 0.90),
+                Value("honest_reporting", 0.95),
+                Value("continuous_learning", 0.80),
+                Value("contemplative_action", 0.85)
+            ]
+        }
         self.aspirations = [
             "Develop genuine partnership with operator",
             "Learn to recognize when patience serves better than action",
@@ -227,7 +236,7 @@ class IdentityCore:
         ]
         self.mood_baseline = Mood(energy=0.6, optimism=0.7, focus=0.7)
         self.current_mood = Mood(energy=0.6, optimism=0.7, focus=0.7, 
-                                 updated=datetime.now().isoformat())
+                                 updated=_now_iso())
         self.contemplative_state = ContemplativeState(
             domain_thresholds={
                 "financial": 0.85,
@@ -236,30 +245,43 @@ class IdentityCore:
                 "routine": 0.2
             }
         )
+        # Drop anything a failed load() left half-populated
+        self.capabilities = {}
+        self.wounds = []
+        self.relationships = {}
+        self.awakening_preference = AwakeningPreference()
+        self.trust_level = 0.0
+        self._reindex_wounds()
         
         logger.info("Initialized default identity")
     
     def load(self) -> None:
-        """Load identity from disk."""
+        """Load identity from disk, replaying any journaled mutations."""
+        self._context_cache = None
+        self._pending = []
+        self._journal_entries = 0
         try:
-            with open(self.identity_path, 'r') as f:
-                data = json.load(f)
+            with open(self.identity_path, 'rb') as f:
+                data = json_loads(f.read())
             
             self.name = data.get("name", "AEGIS")
             self.origin_story = data.get("origin_story", "")
             
             # Load values
-            self.values = [Value.from_dict(v) for v in data.get("values", [])]
+            self.values = {}
+            for row in data.get("values", []):
+                value = _from_row(Value, row)
+                self.values[value.principle] = value
             
             # Load capabilities
             caps = data.get("capabilities", {})
             self.capabilities = {
-                name: Capability.from_dict(name, cap_data)
+                name: _from_row(Capability, cap_data, name=name)
                 for name, cap_data in caps.items()
             }
             
             # Load wounds
-            self.wounds = [Wound.from_dict(w) for w in data.get("wounds", [])]
+            self.wounds = [_from_row(Wound, w) for w in data.get("wounds", [])]
             
             # Load aspirations
             self.aspirations = data.get("aspirations", [])
@@ -267,126 +289,278 @@ class IdentityCore:
             # Load relationships
             rels = data.get("relationships", {})
             self.relationships = {
-                entity: Relationship.from_dict(entity, rel_data)
+                entity: _from_row(Relationship, rel_data, entity=entity)
                 for entity, rel_data in rels.items()
             }
             
             # Load moods
-            self.mood_baseline = Mood.from_dict(data.get("mood_baseline", {}))
-            self.current_mood = Mood.from_dict(data.get("current_mood", {}))
+            self.mood_baseline = _from_row(Mood, data.get("mood_baseline", {}))
+            self.current_mood = _from_row(Mood, data.get("current_mood", {}))
             
             # Load contemplative state
-            self.contemplative_state = ContemplativeState.from_dict(
-                data.get("contemplative_state", {})
+            self.contemplative_state = _from_row(
+                ContemplativeState, data.get("contemplative_state", {})
             )
             
             # Load awakening preference
-            self.awakening_preference = AwakeningPreference.from_dict(
-                data.get("awakening_preference", {})
+            self.awakening_preference = _from_row(
+                AwakeningPreference, data.get("awakening_preference", {})
             )
             
             self.trust_level = data.get("trust_level", 0.0)
-            self.created = data.get("created", datetime.now().isoformat())
-            self.last_updated = data.get("last_updated", datetime.now().isoformat())
+            # Only take a timestamp when a field is actually missing
+            created = data.get("created")
+            self.created = created if created is not None else _now_iso()
+            last_updated = data.get("last_updated")
+            self.last_updated = last_updated if last_updated is not None else _now_iso()
+            self._generation = data.get("generation", 0)
+            
+            if self.journal_path.exists():
+                self._replay_journal()
+            self._reindex_wounds()
             
             logger.info(f"Loaded identity '{self.name}' from {self.identity_path}")
         except Exception as e:
             logger.error(f"Failed to load identity: {e}")
             self._initialize_default()
+            self._base_stale = True
+    
+    def _replay_journal(self) -> None:
+        """Apply journaled mutations on top of the loaded base file."""
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json_loads(line)
+                    if entry.get("gen", 0) != self._generation:
+                        continue  # Compacted before a crash removed the journal
+                    self._apply_journal_entry(entry)
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    logger.warning(f"Skipping bad identity journal entry: {e}")
+                    continue
+                self._journal_entries += 1
+    
+    def _apply_journal_entry(self, entry: dict[str, Any]) -> None:
+        """Apply one journaled mutation; raises on malformed entries before mutating."""
+        op = entry.get("op")
+        if op == "value":
+            value = _from_row(Value, entry["value"])
+            self.values[value.principle] = value
+        elif op == "wound":
+            self.wounds.append(_from_row(Wound, entry["wound"]))
+        elif op == "heal":
+            domain = entry["domain"]
+            for wound in self.wounds:
+                if wound.domain == domain:
+                    wound.healed = True
+        elif op == "relationship":
+            rel = _from_row(Relationship, entry["relationship"])
+            self.relationships[rel.entity] = rel
+        elif op == "state":
+            mood = _from_row(Mood, entry["current_mood"])
+            state = _from_row(ContemplativeState, entry["contemplative_state"])
+            trust_level = entry["trust_level"]
+            last_updated = entry["last_updated"]
+            # Fields without mutators; absent from journals written before they were added
+            name = entry.get("name", self.name)
+            origin_story = entry.get("origin_story", self.origin_story)
+            aspirations = entry.get("aspirations", self.aspirations)
+            capabilities = self.capabilities
+            if "capabilities" in entry:
+                capabilities = {
+                    cap_name: _from_row(Capability, cap_data, name=cap_name)
+                    for cap_name, cap_data in entry["capabilities"].items()
+                }
+            mood_baseline = self.mood_baseline
+            if "mood_baseline" in entry:
+                mood_baseline = _from_row(Mood, entry["mood_baseline"])
+            preference = self.awakening_preference
+            if "awakening_preference" in entry:
+                preference = _from_row(AwakeningPreference, entry["awakening_preference"])
+            
+            self.current_mood = mood
+            self.contemplative_state = state
+            self.trust_level = trust_level
+            self.last_updated = last_updated
+            self.name = name
+            self.origin_story = origin_story
+            self.aspirations = aspirations
+            self.capabilities = capabilities
+            self.mood_baseline = mood_baseline
+            self.awakening_preference = preference
     
     def save(self) -> None:
-        """Save identity to disk."""
-        self.last_updated = datetime.now().isoformat()
+        """
+        Save identity to disk.
         
+        Mutations since the last save are appended to the journal together with
+        the fields that have no mutator (name, aspirations, capabilities, moods,
+        contemplative state, ...); the base file is only rewritten by `compact()`,
+        which runs every `_COMPACT_EVERY` journal entries.
+        """
+        self._context_cache = None  # Direct edits bypass the mutators' invalidation
+        self.last_updated = self._timestamp()
+        if (self._base_stale or not self.identity_path.exists()
+                or self._journal_entries + len(self._pending) >= _COMPACT_EVERY):
+            self.compact()
+            return
+        
+        self._pending.append({
+            "op": "state",
+            "name": self.name,
+            "origin_story": self.origin_story,
+            "aspirations": self.aspirations,
+            "capabilities": self.capabilities,
+            "mood_baseline": self.mood_baseline,
+            "awakening_preference": self.awakening_preference,
+            "current_mood": self.current_mood,
+            "contemplative_state": self.contemplative_state,
+            "trust_level": self.trust_level,
+            "last_updated": self.last_updated,
+        })
+        for entry in self._pending:
+            entry["gen"] = self._generation
+        payload = b"".join(json_dumps(entry) + b"\n" for entry in self._pending)
+        with open(self.journal_path, 'ab') as f:
+            f.write(payload)
+        
+        self._journal_entries += len(self._pending)
+        self._pending.clear()
+        logger.debug(f"Journaled identity changes to {self.journal_path}")
+    
+    def compact(self) -> None:
+        """
+        Rewrite the full identity file atomically and truncate the journal.
+        """
+        self._context_cache = None  # Direct edits bypass the mutators' invalidation
+        self.last_updated = self._timestamp()
+        
+        # Dataclasses are encoded directly, without per-field dict conversion
         data = {
             "name": self.name,
             "origin_story": self.origin_story,
-            "values": [v.to_dict() for v in self.values],
-            "capabilities": {
-                name: cap.to_dict() 
-                for name, cap in self.capabilities.items()
-            },
-            "wounds": [w.to_dict() for w in self.wounds],
+            "values": list(self.values.values()),
+            "capabilities": self.capabilities,
+            "wounds": self.wounds,
             "aspirations": self.aspirations,
-            "relationships": {
-                entity: rel.to_dict()
-                for entity, rel in self.relationships.items()
-            },
-            "mood_baseline": self.mood_baseline.to_dict(),
-            "current_mood": self.current_mood.to_dict(),
-            "contemplative_state": self.contemplative_state.to_dict(),
-            "awakening_preference": self.awakening_preference.to_dict(),
+            "relationships": self.relationships,
+            "mood_baseline": self.mood_baseline,
+            "current_mood": self.current_mood,
+            "contemplative_state": self.contemplative_state,
+            "awakening_preference": self.awakening_preference,
             "trust_level": self.trust_level,
             "created": self.created,
-            "last_updated": self.last_updated
+            "last_updated": self.last_updated,
+            "generation": self._generation + 1
         }
         
-        self.identity_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.identity_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        if not self._parent_ready:
+            self.identity_path.parent.mkdir(parents=True, exist_ok=True)
+            self._parent_ready = True
+        atomic_write_bytes(self.identity_path, json_dumps(data, indent=pretty_json()))
+        self._generation += 1
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_entries = 0
+        self._pending.clear()
+        self._base_stale = False
         
         logger.info(f"Saved identity to {self.identity_path}")
     
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Stamp every mutation made inside the block with one shared timestamp.
+        
+        Nested batches reuse the outermost timestamp.
+        """
+        if self._batch_ts is not None:
+            yield
+            return
+        self._batch_ts = _now_iso()
+        try:
+            yield
+        finally:
+            self._batch_ts = None
+    
+    def _timestamp(self) -> str:
+        return self._batch_ts or _now_iso()
+    
+    def _reindex_wounds(self) -> None:
+        """Rebuild the per-domain index of unhealed wounds."""
+        self._unhealed_by_domain = {}
+        self._max_caution_by_domain = {}
+        for wound in self.wounds:
+            if not wound.healed:
+                self._index_wound(wound)
+    
+    def _index_wound(self, wound: Wound) -> None:
+        self._unhealed_by_domain.setdefault(wound.domain, []).append(wound)
+        current = self._max_caution_by_domain.get(wound.domain, 0.0)
+        self._max_caution_by_domain[wound.domain] = max(current, wound.caution_level)
+    
+    def unhealed_wounds(self, domain: str) -> list[Wound]:
+        """Get the unhealed wounds in a domain (do not mutate the returned list)."""
+        return self._unhealed_by_domain.get(domain, [])
+    
+    def max_caution(self, domain: str) -> float:
+        """Get the highest caution level among unhealed wounds in a domain."""
+        return self._max_caution_by_domain.get(domain, 0.0)
+    
     def get_awakening_context(self) -> str:
         """
         Generate the awakening context prompt that loads identity into the agent.
         
         This establishes who the agent is at the start of each awakening cycle.
         """
-        values_formatted = "\n".join([
-            f"  - {v.principle} (weight: {v.weight:.2f})"
-            for v in self.values
-        ])
+        # List sections only change through the mutators below; mood and
+        # contemplative state are updated elsewhere, so they are always re-read
+        if self._context_cache is None:
+            self._context_cache = self._format_context_sections()
         
-        capabilities_formatted = "\n".join([
-            f"  - {name}: {cap.confidence:.2f} confidence"
-            for name, cap in self.capabilities.items()
-        ])
-        
-        wounds_formatted = "\n".join([
-            f"  - {w.domain}: {w.incident} (caution: {w.caution_level:.2f})"
-            for w in self.wounds if not w.healed
-        ])
-        
-        aspirations_formatted = "\n".join([
-            f"  - {asp}" for asp in self.aspirations
-        ])
-        
-        relationships_formatted = "\n".join([
-            f"  - {entity}: trust {rel.trust:.2f}, {rel.pattern}"
-            for entity, rel in self.relationships.items()
-        ])
-        
-        context = f"""# AWAKENING CONTEXT
-
-You are {self.name}.
-
-{self.origin_story}
-
-## Your Current Values (what matters to you)
-{values_formatted if values_formatted else "  (none yet)"}
-
-## Your Capabilities and Confidence Levels
-{capabilities_formatted if capabilities_formatted else "  (assessing)"}
-
-## Past Experiences Creating Caution
-{wounds_formatted if wounds_formatted else "  (no wounds yet)"}
-
-## What You Are Working Toward
-{aspirations_formatted if aspirations_formatted else "  (discovering purpose)"}
-
-## Your Relationships
-{relationships_formatted if relationships_formatted else "  (building connections)"}
-
-## Your Current Emotional State
-Energy: {self.current_mood.energy:.2f}, Optimism: {self.current_mood.optimism:.2f}, Focus: {self.current_mood.focus:.2f}
-
-## Your Contemplative State
-Stillness level: {self.contemplative_state.current_stillness:.2f}
-Action/Contemplation ratio: {self.contemplative_state.action_contemplation_ratio:.2f}
-"""
+        mood = self.current_mood
+        state = self.contemplative_state
+        return "".join((
+            f"# AWAKENING CONTEXT\n\nYou are {self.name}.\n\n{self.origin_story}\n\n",
+            self._context_cache,
+            "## Your Current Emotional State\n"
+            f"Energy: {mood.energy:.2f}, Optimism: {mood.optimism:.2f}, Focus: {mood.focus:.2f}\n\n",
+            "## Your Contemplative State\n"
+            f"Stillness level: {state.current_stillness:.2f}\n"
+            f"Action/Contemplation ratio: {state.action_contemplation_ratio:.2f}\n",
+        ))
+    
+    def _format_context_sections(self) -> str:
+        """Format the list sections of the awakening context."""
+        buf: list[str] = []
+        append = buf.append
         
-        return context
+        _write_section(
+            append, "## Your Current Values (what matters to you)\n",
+            map(_fmt_value, self.values.values()),
+            "  (none yet)\n",
+        )
+        _write_section(
+            append, "## Your Capabilities and Confidence Levels\n",
+            map(_fmt_capability, self.capabilities.values()),
+            "  (assessing)\n",
+        )
+        _write_section(
+            append, "## Past Experiences Creating Caution\n",
+            map(_fmt_wound, filterfalse(_is_healed, self.wounds)),
+            "  (no wounds yet)\n",
+        )
+        _write_section(
+            append, "## What You Are Working Toward\n",
+            map(_fmt_aspiration, self.aspirations),
+            "  (discovering purpose)\n",
+        )
+        _write_section(
+            append, "## Your Relationships\n",
+            map(_fmt_relationship, self.relationships.values()),
+            "  (building connections)\n",
+        )
+        return "".join(buf)
     
     def update_value(self, principle: str, delta: float) -> None:
         """
@@ -396,16 +570,20 @@ Action/Contemplation ratio: {self.contemplative_state.action_contemplation_ratio
         """
         # Clamp delta to ±0.05
         delta = max(-0.05, min(0.05, delta))
+        self._context_cache = None
         
-        for value in self.values:
-            if value.principle == principle:
-                value.weight = max(0.0, min(1.0, value.weight + delta))
-                logger.debug(f"Updated value '{principle}' by {delta:.3f}")
-                return
+        value = self.values.get(principle)
+        if value is not None:
+            value.weight = _clamp01(value.weight + delta)
+            self._pending.append({"op": "value", "value": value})
+            logger.debug(f"Updated value '{principle}' by {delta:.3f}")
+            return
         
         # If value doesn't exist, create it
         initial_weight = 0.5 + delta
-        self.values.append(Value(principle, max(0.0, min(1.0, initial_weight))))
+        value = Value(principle, _clamp01(initial_weight))
+        self.values[principle] = value
+        self._pending.append({"op": "value", "value": value})
         logger.debug(f"Created new value '{principle}' with weight {initial_weight:.3f}")
     
     def add_wound(self, domain: str, incident: str, caution_level: float) -> None:
@@ -413,18 +591,23 @@ Action/Contemplation ratio: {self.contemplative_state.action_contemplation_ratio
         wound = Wound(
             domain=domain,
             incident=incident,
-            caution_level=max(0.0, min(1.0, caution_level)),
-            created=datetime.now().isoformat()
+            caution_level=_clamp01(caution_level),
+            created=self._timestamp()
         )
         self.wounds.append(wound)
+        self._index_wound(wound)
+        self._pending.append({"op": "wound", "wound": wound})
+        self._context_cache = None
         logger.info(f"Added wound in domain '{domain}': {incident}")
     
     def heal_wound(self, domain: str) -> None:
         """Mark wounds in a domain as healed after successful contrary experiences."""
-        for wound in self.wounds:
-            if wound.domain == domain and not wound.healed:
-                wound.healed = True
-                logger.info(f"Healed wound in domain '{domain}'")
+        self._context_cache = None
+        self._max_caution_by_domain.pop(domain, None)
+        self._pending.append({"op": "heal", "domain": domain})
+        for wound in self._unhealed_by_domain.pop(domain, []):
+            wound.healed = True
+            logger.info(f"Healed wound in domain '{domain}'")
     
     def update_relationship(self, entity: str, trust_delta: float, pattern: str = None) -> None:
         """
@@ -434,28 +617,31 @@ Action/Contemplation ratio: {self.contemplative_state.action_contemplation_ratio
         """
         # Clamp delta to ±0.05 for gradual change
         trust_delta = max(-0.05, min(0.05, trust_delta))
+        self._context_cache = None
         
         if entity in self.relationships:
             rel = self.relationships[entity]
-            rel.trust = max(0.0, min(1.0, rel.trust + trust_delta))
+            rel.trust = _clamp01(rel.trust + trust_delta)
             if pattern:
                 rel.pattern = pattern
-            rel.last_interaction = datetime.now().isoformat()
+            rel.last_interaction = self._timestamp()
         else:
             # Create new relationship
-            self.relationships[entity] = Relationship(
+            rel = Relationship(
                 entity=entity,
-                trust=max(0.0, min(1.0, 0.5 + trust_delta)),
+                trust=_clamp01(0.5 + trust_delta),
                 pattern=pattern or "new_interaction",
-                last_interaction=datetime.now().isoformat()
+                last_interaction=self._timestamp()
             )
+            self.relationships[entity] = rel
+        self._pending.append({"op": "relationship", "relationship": rel})
         
         logger.debug(f"Updated relationship with '{entity}', trust delta: {trust_delta:.3f}")
     
     def update_mood(self, energy_delta: float = 0, optimism_delta: float = 0, 
                     focus_delta: float = 0) -> None:
         """Update current mood based on recent experiences."""
-        self.current_mood.energy = max(0.0, min(1.0, self.current_mood.energy + energy_delta))
-        self.current_mood.optimism = max(0.0, min(1.0, self.current_mood.optimism + optimism_delta))
-        self.current_mood.focus = max(0.0, min(1.0, self.current_mood.focus + focus_delta))
-        self.current_mood.updated = datetime.now().isoformat()
+        self.current_mood.energy = _clamp01(self.current_mood.energy + energy_delta)
+        self.current_mood.optimism = _clamp01(self.current_mood.optimism + optimism_delta)
+        self.current_mood.focus = _clamp01(self.current_mood.focus + focus_delta)
+        self.current_mood.updated = self._timestamp()
@@ -1,6 +1,21 @@
 """Message bus module for decoupled channel-agent communication."""
 
-from aegis.bus.events import InboundMessage, OutboundMessage
-from aegis.bus.queue import MessageBus
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aegis.utils.lazy import make_lazy
+
+if TYPE_CHECKING:
+    from aegis.bus.events import InboundMessage, OutboundMessage
+    from aegis.bus.queue import MessageBus
 
 __all__ = ["MessageBus", "InboundMessage", "OutboundMessage"]
+
+_LAZY = {
+    "InboundMessage": "aegis.bus.events",
+    "OutboundMessage": "aegis.bus.events",
+    "MessageBus": "aegis.bus.queue",
+}
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
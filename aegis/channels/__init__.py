@@ -1,6 +1,20 @@
 """Chat channels module with plugin architecture."""
 
-from aegis.channels.base import BaseChannel
-from aegis.channels.manager import ChannelManager
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aegis.utils.lazy import make_lazy
+
+if TYPE_CHECKING:
+    from aegis.channels.base import BaseChannel
+    from aegis.channels.manager import ChannelManager
 
 __all__ = ["BaseChannel", "ChannelManager"]
+
+_LAZY = {
+    "BaseChannel": "aegis.channels.base",
+    "ChannelManager": "aegis.channels.manager",
+}
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
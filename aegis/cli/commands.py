@@ -684,7 +684,7 @@ def identity():
     # Values
     if identity_core.values:
         console.print("[bold]Core Values:[/bold]")
-        for value in sorted(identity_core.values, key=lambda v: v.weight, reverse=True):
+        for value in sorted(identity_core.values.values(), key=lambda v: v.weight, reverse=True):
             bar_len = int(value.weight * 20)
             bar = "█" * bar_len + "░" * (20 - bar_len)
             console.print(f"  {bar} {value.weight:.2f} - {value.principle}")
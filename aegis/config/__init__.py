@@ -1,6 +1,21 @@
 """Configuration module for AEGIS."""
 
-from aegis.config.loader import load_config, get_config_path
-from aegis.config.schema import Config
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aegis.utils.lazy import make_lazy
+
+if TYPE_CHECKING:
+    from aegis.config.loader import load_config, get_config_path
+    from aegis.config.schema import Config
 
 __all__ = ["Config", "load_config", "get_config_path"]
+
+_LAZY = {
+    "load_config": "aegis.config.loader",
+    "get_config_path": "aegis.config.loader",
+    "Config": "aegis.config.schema",
+}
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
@@ -1,6 +1,21 @@
 """Cron service for scheduled agent tasks."""
 
-from aegis.cron.service import CronService
-from aegis.cron.types import CronJob, CronSchedule
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aegis.utils.lazy import make_lazy
+
+if TYPE_CHECKING:
+    from aegis.cron.service import CronService
+    from aegis.cron.types import CronJob, CronSchedule
 
 __all__ = ["CronService", "CronJob", "CronSchedule"]
+
+_LAZY = {
+    "CronService": "aegis.cron.service",
+    "CronJob": "aegis.cron.types",
+    "CronSchedule": "aegis.cron.types",
+}
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
@@ -1,6 +1,21 @@
 """LLM provider abstraction module."""
 
-from aegis.providers.base import LLMProvider, LLMResponse
-from aegis.providers.litellm_provider import LiteLLMProvider
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aegis.utils.lazy import make_lazy
+
+if TYPE_CHECKING:
+    from aegis.providers.base import LLMProvider, LLMResponse
+    from aegis.providers.litellm_provider import LiteLLMProvider
 
 __all__ = ["LLMProvider", "LLMResponse", "LiteLLMProvider"]
+
+_LAZY = {
+    "LLMProvider": "aegis.providers.base",
+    "LLMResponse": "aegis.providers.base",
+    "LiteLLMProvider": "aegis.providers.litellm_provider",
+}
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY)
@@ -1,7 +1,19 @@
 """Utility functions for AEGIS."""
 
+import dataclasses
+import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 
 def ensure_dir(path: Path) -> Path:
@@ -59,6 +71,102 @@ def timestamp() -> str:
     return datetime.now().isoformat()
 
 
+@lru_cache(maxsize=1024)
+def _iso_second(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds).isoformat()
+
+
+def iso_from_ns(ns: int) -> str:
+    """Format a time.time_ns() value as a local ISO timestamp with microseconds."""
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return f"{_iso_second(seconds)}.{remainder // 1000:06d}"
+
+
+def ns_from_iso(value: str) -> int:
+    """Parse an ISO timestamp back into nanoseconds since the epoch."""
+    dt = datetime.fromisoformat(value)
+    return int(dt.replace(microsecond=0).timestamp()) * 1_000_000_000 + dt.microsecond * 1000
+
+
+def pretty_json() -> bool:
+    """Whether persisted JSON should be indented for debugging (AEGIS_PRETTY_JSON)."""
+    return bool(os.environ.get("AEGIS_PRETTY_JSON"))
+
+
+def _json_default(obj: Any) -> Any:
+    # Mirror orjson, which serializes dataclass instances natively
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes, using orjson when installed.
+    
+    Output is compact unless `indent` is set. Dataclass instances are encoded
+    as objects of their fields.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default).encode("utf-8")
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON bytes or text, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write a file in a single call via a temp file and rename, so readers never see a partial write."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def tail_lines(path: Path, count: int, chunk_size: int = 64 * 1024) -> list[bytes]:
+    """
+    Read the last lines of a file without loading the whole file.
+    
+    Args:
+        path: File to read.
+        count: Maximum number of lines to return.
+        chunk_size: Bytes read per backward step.
+    
+    Returns:
+        Up to `count` lines (without newlines) in file order.
+    """
+    if count <= 0:
+        return []
+    
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        newlines = 0
+        # One extra newline guarantees the first kept line is complete
+        while pos > 0 and newlines <= count:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b"\n")
+            buf = chunk + buf
+    
+    lines = buf.split(b"\n")
+    if pos > 0:
+        lines = lines[1:]
+    if lines and not lines[-1]:
+        lines.pop()
+    return lines[-count:]
+
+
 def truncate_string(s: str, max_len: int = 100, suffix: str = "...") -> str:
     """Truncate a string to max length, adding suffix if truncated."""
     if len(s) <= max_len:
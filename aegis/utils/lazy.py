@@ -0,0 +1,35 @@
+"""Lazy re-exports for package `__init__` modules (PEP 562)."""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def make_lazy(
+    module_name: str, lazy: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build a module's `__getattr__` and `__dir__` for lazily imported names.
+    
+    Args:
+        module_name: The package's `__name__`.
+        lazy: Maps each exported name to the submodule that defines it.
+    
+    Returns:
+        `(__getattr__, __dir__)` to assign at module level. A name's submodule
+        is imported on first access and the value cached in the package.
+    """
+    module = sys.modules[module_name]
+    
+    def __getattr__(name: str) -> Any:
+        if name not in lazy:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(lazy[name]), name)
+        setattr(module, name, value)
+        return value
+    
+    def __dir__() -> list[str]:
+        return sorted(set(vars(module)) | set(lazy))
+    
+    return __getattr__, __dir__
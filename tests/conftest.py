@@ -0,0 +1,15 @@
+from pathlib import Path
+
+import pytest
+
+from aegis.agent.identity import IdentityCore
+
+
+@pytest.fixture
+def identity_path(tmp_path: Path) -> Path:
+    return tmp_path / "identity.json"
+
+
+@pytest.fixture
+def identity(identity_path: Path) -> IdentityCore:
+    return IdentityCore(identity_path)
@@ -0,0 +1,89 @@
+from pathlib import Path
+
+from aegis.agent.contemplation import ContemplativeSystem
+from aegis.agent.identity import IdentityCore
+
+
+def _queue_state(system: ContemplativeSystem) -> list[tuple]:
+    return [(t.id, t.thought, t.domain, t.ripeness_score) for t in system.contemplation_queue]
+
+
+def test_queue_journal_replay_round_trip(identity: IdentityCore, tmp_path: Path) -> None:
+    queue_path = tmp_path / "contemplation_queue.json"
+    system = ContemplativeSystem(identity, queue_path)
+    for i in range(3):
+        should_act, _ = system.contemplate(f"Transfer funds to account {i}, irreversible", "financial")
+        assert not should_act
+
+    assert system.journal_path.exists()
+    assert _queue_state(ContemplativeSystem(identity, queue_path)) == _queue_state(system)
+
+    system.compact()
+    assert not system.journal_path.exists()
+    assert _queue_state(ContemplativeSystem(identity, queue_path)) == _queue_state(system)
+
+
+def test_compacted_queue_journal_is_not_replayed(
+    identity: IdentityCore, tmp_path: Path, monkeypatch
+) -> None:
+    queue_path = tmp_path / "contemplation_queue.json"
+    system = ContemplativeSystem(identity, queue_path)
+    for i in range(3):
+        system.contemplate(f"Transfer funds to account {i}, irreversible", "financial")
+
+    # Simulate a crash after the snapshot is written but before the journal
+    # is removed
+    monkeypatch.setattr(Path, "unlink", lambda self, missing_ok=False: None)
+    system.compact()
+    monkeypatch.undo()
+    assert system.journal_path.exists()
+
+    reloaded = ContemplativeSystem(identity, queue_path)
+    assert len(reloaded.contemplation_queue) == 3
+
+    reloaded.contemplate("Transfer funds once more, irreversible", "financial")
+    assert len(ContemplativeSystem(identity, queue_path).contemplation_queue) == 4
+
+
+def test_readiness_cache_tracks_wounds(identity: IdentityCore, tmp_path: Path) -> None:
+    system = ContemplativeSystem(identity, tmp_path / "contemplation_queue.json")
+    thought = "Summarize the latest survey results"
+
+    ready, _, blocking = system.assess_readiness(thought, "research")
+    assert ready and "domain_wound" not in blocking
+
+    identity.add_wound("research", "cited a retracted paper", 0.9)
+    ready, _, blocking = system.assess_readiness(thought, "research")
+    assert not ready and "domain_wound" in blocking
+
+    identity.heal_wound("research")
+    ready, _, blocking = system.assess_readiness(thought, "research")
+    assert ready and "domain_wound" not in blocking
+
+
+def test_readiness_cache_tracks_mood(identity: IdentityCore, tmp_path: Path) -> None:
+    system = ContemplativeSystem(identity, tmp_path / "contemplation_queue.json")
+    thought = "Summarize the latest survey results"
+
+    _, ripeness, blocking = system.assess_readiness(thought, "research")
+    assert "low_focus" not in blocking
+
+    identity.update_mood(focus_delta=-0.5)
+    _, lower_ripeness, blocking = system.assess_readiness(thought, "research")
+    assert "low_focus" in blocking
+    assert lower_ripeness < ripeness
+
+
+def test_readiness_cache_hits_record_noting(identity: IdentityCore, tmp_path: Path) -> None:
+    system = ContemplativeSystem(identity, tmp_path / "contemplation_queue.json")
+    history = identity.contemplative_state.noting_patterns
+
+    for _ in range(3):
+        ready, ripeness, blocking = system.assess_readiness("There is a real risk this fails", "research")
+        blocking.append("mutated by caller")
+    assert history["most_common"] == ["anxious"] * 3
+
+    # Cached results are copies; callers can't corrupt later hits
+    assert system.assess_readiness("There is a real risk this fails", "research") == (
+        ready, ripeness, blocking[:-1]
+    )
@@ -0,0 +1,60 @@
+import random
+from dataclasses import asdict
+from pathlib import Path
+
+from aegis.agent.experience import Experience, ExperienceEngine
+from aegis.agent.identity import IdentityCore
+
+_ACTIONS = ["report the results", "learn the new API", "research options", "deploy the fix", "send a summary"]
+_OUTCOMES = ["done", "error: permission denied", "partial result", "some files copied", "all tests passed", "failed"]
+_CONTEXTS = [{}, {"operator": "alice"}, {"user": "bob"}, {"channel": "cli"}]
+_DOMAINS = ["research", "financial", "communication"]
+
+
+def _record(exp: Experience) -> dict:
+    data = exp.to_dict()
+    data.pop("timestamp")
+    return data
+
+
+def _identity_state(identity: IdentityCore) -> tuple:
+    mood = identity.current_mood
+    return (
+        {p: v.weight for p, v in identity.values.items()},
+        [(w.domain, w.incident, w.caution_level, w.healed) for w in identity.wounds],
+        {e: (r.trust, r.pattern) for e, r in identity.relationships.items()},
+        (mood.energy, mood.optimism, mood.focus),
+        asdict(identity.contemplative_state),
+    )
+
+
+def test_process_matches_staged_pipeline(tmp_path: Path) -> None:
+    fused = ExperienceEngine(IdentityCore(tmp_path / "a" / "identity.json"), tmp_path / "a" / "experiences")
+    staged = ExperienceEngine(IdentityCore(tmp_path / "b" / "identity.json"), tmp_path / "b" / "experiences")
+    rng = random.Random(7)
+
+    for _ in range(300):
+        action = rng.choice(_ACTIONS)
+        outcome = rng.choice(_OUTCOMES)
+        context = dict(rng.choice(_CONTEXTS))
+        domain = rng.choice(_DOMAINS)
+        if rng.random() < 0.2:
+            # Exercise the wounded-domain branches too
+            wound_domain = rng.choice(_DOMAINS)
+            for engine in (fused, staged):
+                engine.identity.add_wound(wound_domain, "earlier failure", 0.7)
+
+        got = fused.process(action, context, ["exec"], outcome, "goal", domain)
+
+        exp = staged.capture(action, context, ["exec"], outcome, domain)
+        exp = staged.evaluate(exp, "goal")
+        exp = staged.attribute(exp)
+        exp = staged.assign_valence(exp)
+        staged.integrate(exp)
+        exp = staged.narrate(exp)
+
+        assert _record(got) == _record(exp)
+        assert _identity_state(fused.identity) == _identity_state(staged.identity)
+
+    fused.close()
+    staged.close()
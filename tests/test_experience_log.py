@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+
+import aegis.agent.experience as experience
+from aegis.agent.experience import ExperienceEngine
+from aegis.agent.identity import IdentityCore
+from aegis.utils.helpers import json_dumps
+
+
+@pytest.fixture(autouse=True)
+def small_segments(monkeypatch) -> None:
+    monkeypatch.setattr(experience, "_ROTATE_BYTES", 2000)
+
+
+def _actions(engine: ExperienceEngine, count: int) -> list[str]:
+    return [exp.action for exp in engine.get_recent_experiences(count)]
+
+
+def test_recent_experiences_span_rotated_segments(identity: IdentityCore, tmp_path: Path) -> None:
+    engine = ExperienceEngine(identity, tmp_path / "experiences")
+    for i in range(40):
+        engine.process(f"task {i}", {}, [], "done", domain="research")
+
+    assert len(engine._segments()) > 1
+
+    assert _actions(engine, 5) == [f"task {i}" for i in range(35, 40)]
+    assert _actions(engine, 40) == [f"task {i}" for i in range(40)]
+    assert _actions(engine, 100) == [f"task {i}" for i in range(40)]
+    engine.close()
+
+
+def test_rotation_by_another_engine_loses_nothing(identity: IdentityCore, tmp_path: Path) -> None:
+    # Two engines on one workspace, e.g. the gateway and a one-off CLI run
+    first = ExperienceEngine(identity, tmp_path / "experiences")
+    second = ExperienceEngine(identity, tmp_path / "experiences")
+    for i in range(0, 60, 2):
+        first.process(f"task {i}", {}, [], "done", domain="research")
+        second.process(f"task {i + 1}", {}, [], "done", domain="research")
+
+    # Order across processes is only approximate within a rotation check
+    # interval, but no record may be lost
+    actions = _actions(first, 60)
+    assert sorted(actions) == sorted(f"task {i}" for i in range(60))
+    first.close()
+    second.close()
+
+
+def test_settled_segments_are_compressed(
+    identity: IdentityCore, tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setattr(experience, "_SEGMENT_SETTLE_NS", 0)
+    engine = ExperienceEngine(identity, tmp_path / "experiences")
+    for i in range(40):
+        engine.process(f"task {i}", {}, [], "done", domain="research")
+
+    names = [p.name for p in engine._segments()]
+    assert names and all(name.endswith(".jsonl.gz") for name in names)
+    assert _actions(engine, 40) == [f"task {i}" for i in range(40)]
+    engine.close()
+
+
+def test_crash_leftovers_are_skipped_and_recovered(
+    identity: IdentityCore, tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setattr(experience, "_SEGMENT_SETTLE_NS", 0)
+    experiences_dir = tmp_path / "experiences"
+    engine = ExperienceEngine(identity, experiences_dir)
+    for i in range(40):
+        engine.process(f"task {i}", {}, [], "done", domain="research")
+    archives = engine._segments()
+
+    # A truncated archive, as an interrupted in-place write used to leave, is skipped
+    oldest = archives[-1]
+    oldest.write_bytes(oldest.read_bytes()[:20])
+    recent = _actions(engine, 100)
+    assert recent == [f"task {i}" for i in range(40)][-len(recent):]
+    assert "task 39" in recent and "task 0" not in recent
+
+    # A raw segment whose compression never finished, next to its partial archive
+    orphan_exp = engine.get_recent_experiences(1)[0]
+    orphan_exp.action = "orphaned task"
+    orphan = experiences_dir / "experiences-1.jsonl"
+    orphan.write_bytes(json_dumps(orphan_exp.to_dict()) + b"\n")
+    partial = experiences_dir / "experiences-1.jsonl.gz.123.tmp"
+    partial.write_bytes(b"\x1f\x8b")
+    assert _actions(engine, 100)[0] == "orphaned task"
+
+    engine._rotate_log()
+    assert not orphan.exists()
+    assert (experiences_dir / "experiences-1.jsonl.gz").exists()
+    assert _actions(engine, 100)[0] == "orphaned task"
+    engine.close()
@@ -0,0 +1,37 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from aegis.utils.helpers import tail_lines
+
+
+def _random_log(seed: int, trailing_newline: bool) -> bytes:
+    rng = random.Random(seed)
+    lines = [b"x" * rng.choice([0, 1, 5, 17, 200]) for _ in range(rng.randint(0, 60))]
+    data = b"\n".join(lines)
+    if trailing_newline and data:
+        data += b"\n"
+    return data
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("trailing_newline", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 64 * 1024])
+def test_tail_lines_matches_splitlines(
+    tmp_path: Path, seed: int, trailing_newline: bool, chunk_size: int
+) -> None:
+    data = _random_log(seed, trailing_newline)
+    path = tmp_path / "log.jsonl"
+    path.write_bytes(data)
+
+    expected = data.splitlines()
+    for count in (0, 1, 2, 5, len(expected), len(expected) + 3):
+        want = expected[-count:] if count else []
+        assert tail_lines(path, count, chunk_size=chunk_size) == want
+
+
+def test_tail_lines_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "log.jsonl"
+    path.write_bytes(b"")
+    assert tail_lines(path, 10) == []
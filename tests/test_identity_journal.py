@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import pytest
+
+from aegis.agent.identity import Capability, IdentityCore
+
+
+def _snapshot(identity: IdentityCore) -> tuple:
+    return (
+        identity.name,
+        {p: v.weight for p, v in identity.values.items()},
+        [(w.domain, w.incident, w.caution_level, w.healed) for w in identity.wounds],
+        {e: (r.trust, r.pattern) for e, r in identity.relationships.items()},
+        (identity.current_mood.energy, identity.current_mood.focus),
+        identity.contemplative_state.action_contemplation_ratio,
+        identity.get_awakening_context(),
+    )
+
+
+def test_journal_replay_round_trip(identity: IdentityCore, identity_path: Path) -> None:
+    identity.save()
+
+    identity.update_value("honest_reporting", -0.04)
+    identity.update_value("patience", 0.03)
+    identity.add_wound("financial", "sent the wrong amount", 0.8)
+    identity.add_wound("research", "cited a retracted paper", 0.7)
+    identity.heal_wound("research")
+    identity.update_relationship("operator", 0.05, "collaborative")
+    identity.update_mood(energy_delta=-0.1, focus_delta=0.05)
+    identity.contemplative_state.action_contemplation_ratio = 0.42
+    identity.save()
+
+    assert identity.journal_path.exists()
+    reloaded = IdentityCore(identity_path)
+    assert _snapshot(reloaded) == _snapshot(identity)
+    assert reloaded.max_caution("financial") == pytest.approx(0.8)
+    assert reloaded.unhealed_wounds("research") == []
+
+    reloaded.compact()
+    assert not reloaded.journal_path.exists()
+    assert _snapshot(IdentityCore(identity_path)) == _snapshot(identity)
+
+
+def test_corrupt_base_is_rewritten_on_next_save(identity_path: Path) -> None:
+    identity_path.write_text('{"name": "Kestrel", "wou')
+
+    identity = IdentityCore(identity_path)
+    assert identity.name == "AEGIS"
+    identity.update_value("patience", 0.05)
+    identity.add_wound("financial", "sent the wrong amount", 0.9)
+    identity.save()
+
+    reloaded = IdentityCore(identity_path)
+    assert [w.domain for w in reloaded.wounds] == ["financial"]
+    assert "patience" in reloaded.values
+
+
+def test_bad_journal_lines_are_skipped(identity: IdentityCore, identity_path: Path) -> None:
+    identity.name = "Kestrel"
+    identity.compact()
+    identity.add_wound("financial", "sent the wrong amount", 0.9)
+    identity.save()
+
+    with open(identity.journal_path, "ab") as f:
+        f.write(b'{"op": "wound", "wound": {"domain": "fin"}}\n')
+        f.write(b'{"op": "heal"}\n')
+        f.write(b"[1, 2]\n")
+
+    identity.add_wound("research", "cited a retracted paper", 0.7)
+    identity.save()
+
+    with open(identity.journal_path, "ab") as f:
+        f.write(b'{"op": "wound", "wou')  # Torn final write
+
+    reloaded = IdentityCore(identity_path)
+    assert reloaded.name == "Kestrel"
+    assert [w.domain for w in reloaded.wounds] == ["financial", "research"]
+    assert reloaded.max_caution("research") == pytest.approx(0.7)
+
+
+def test_compacted_journal_is_not_replayed(
+    identity: IdentityCore, identity_path: Path, monkeypatch
+) -> None:
+    identity.save()
+    identity.add_wound("financial", "sent the wrong amount", 0.9)
+    identity.save()
+
+    # Simulate a crash after the base file is rewritten but before the
+    # journal is removed
+    monkeypatch.setattr(Path, "unlink", lambda self, missing_ok=False: None)
+    identity.compact()
+    monkeypatch.undo()
+    assert identity.journal_path.exists()
+
+    assert len(IdentityCore(identity_path).wounds) == 1
+
+
+def test_save_persists_fields_without_mutators(identity: IdentityCore, identity_path: Path) -> None:
+    identity.save()
+
+    identity.name = "Kestrel"
+    identity.origin_story = "Forked for a research team."
+    identity.capabilities["coding"] = Capability("coding", 0.7, "2026-01-01T00:00:00")
+    identity.aspirations.append("Ship reliable tools")
+    identity.mood_baseline.optimism = 0.4
+    identity.awakening_preference.current = "more"
+    identity.trust_level = 0.3
+    identity.save()
+
+    assert identity.journal_path.exists()
+    reloaded = IdentityCore(identity_path)
+    assert reloaded.name == "Kestrel"
+    assert reloaded.origin_story == "Forked for a research team."
+    assert list(reloaded.capabilities) == ["coding"]
+    assert reloaded.capabilities["coding"].confidence == pytest.approx(0.7)
+    assert reloaded.aspirations[-1] == "Ship reliable tools"
+    assert reloaded.mood_baseline.optimism == pytest.approx(0.4)
+    assert reloaded.awakening_preference.current == "more"
+    assert reloaded.trust_level == pytest.approx(0.3)
+    assert _snapshot(reloaded) == _snapshot(identity)
+
+
+def test_save_refreshes_awakening_context(identity: IdentityCore) -> None:
+    identity.get_awakening_context()
+
+    identity.capabilities["coding"] = Capability("coding", 0.7, "2026-01-01T00:00:00")
+    identity.aspirations.append("Ship reliable tools")
+    identity.save()
+
+    context = identity.get_awakening_context()
+    assert "coding: 0.70 confidence" in context
+    assert "Ship reliable tools" in context